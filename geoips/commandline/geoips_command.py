@@ -23,6 +23,30 @@ from geoips.commandline.cmd_instructions import cmd_instructions, alias_mapping
 from geoips.commandline.log_setup import setup_logging
 
 
+class ArgumentChoices(tuple):
+    """Tuple of argparse choices supporting constant time membership tests.
+
+    argparse validates a parsed value via ``value in action.choices`` and iterates
+    the choices when formatting help / error messages. Keeping the tuple ordering for
+    the latter while backing ``in`` with a frozenset avoids a linear scan of every
+    choice each time an argument is parsed.
+    """
+
+    def __new__(cls, choices=()):
+        """Create the ordered choices and their frozenset counterpart."""
+        self = super().__new__(cls, choices)
+        self._choice_set = frozenset(self)
+        return self
+
+    def __contains__(self, value):
+        """Return True if value is one of the available choices."""
+        try:
+            return value in self._choice_set
+        except TypeError:
+            # Unhashable values can never be a valid choice
+            return False
+
+
 class PluginPackages:
     """Class to hold the plugin packages and their paths.
 
@@ -40,10 +64,10 @@ class PluginPackages:
         Initialize the plugin packages and their paths. This is done by using the
         get_plugin_packages() and get_plugin_package_paths() functions.
         """
-        self.entrypoints = [
+        self.entrypoints = ArgumentChoices(
             ep.value
             for ep in sorted(metadata.entry_points(group="geoips.plugin_packages"))
-        ]
+        )
         self.paths = [
             dirname(resources.files(ep.value))
             for ep in sorted(metadata.entry_points(group="geoips.plugin_packages"))
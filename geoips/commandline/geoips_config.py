@@ -6,14 +6,271 @@
 Various configuration-based commands for setting up your geoips environment.
 """
 
-from numpy import any
-from os import listdir, environ
-from os.path import abspath, join
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+import io
+import os
+from os import environ, makedirs, remove, rename, rmdir, scandir, utime
+from os.path import dirname, exists, getsize, isdir, join, lexists, realpath
 import requests
+from requests.adapters import HTTPAdapter
+from shutil import copyfileobj, rmtree
 import tarfile
+from threading import Condition, Event, Lock
 
-from geoips.commandline.ancillary_info.test_data import test_dataset_dict
+from geoips.commandline.ancillary_info.test_data import (
+    test_dataset_dict,
+    test_dataset_names,
+)
 from geoips.commandline.geoips_command import GeoipsCommand, GeoipsExecutableCommand
+from geoips.utils.context_managers import import_optional_dependencies
+
+igzip = None
+
+with import_optional_dependencies(loglevel="debug"):
+    """Attempt to import Intel ISA-L's accelerated gzip implementation."""
+    from isal import igzip
+
+# Size of each block pulled off of the HTTP socket while streaming test data. Large
+# blocks keep tarfile / gzip reading from memory instead of issuing many small reads
+# against the underlying connection.
+HTTP_CHUNK_SIZE = 1024 * 1024
+# First two bytes of any gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
+# Number of threads writing extracted tar members to disk. Test datasets contain
+# thousands of small files, so open / write / close syscalls dominate extraction time.
+EXTRACT_WORKERS = 32
+# Maximum number of test datasets downloaded and extracted at the same time.
+DOWNLOAD_WORKERS = 4
+# Maximum bytes of member contents held in memory while waiting to be written.
+EXTRACT_BUFFER_SIZE = 64 * 1024 * 1024
+# Members at least this large are streamed straight to disk instead of being buffered.
+LARGE_MEMBER_SIZE = 8 * 1024 * 1024
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+# Kept in sync with setup/download_test_data.py:BufferedHTTPStream, which must run
+# standalone, before geoips itself is installed. Only this copy supports cancel_event,
+# as the setup script never downloads from more than one thread.
+class _BufferedHTTPStream(io.RawIOBase):
+    """Raw, read-only file object over a streamed requests Response.
+
+    Pulls ``chunk_size`` blocks from ``response.iter_content`` and hands them out
+    through ``readinto``, so it can be wrapped in an ``io.BufferedReader`` and passed
+    to ``tarfile.open(fileobj=...)`` instead of the much smaller reads made against
+    ``response.raw``.
+
+    If ``cancel_event`` is set, the next read raises KeyboardInterrupt, so that
+    downloads running outside of the main thread can be interrupted.
+    """
+
+    def __init__(self, response, chunk_size=HTTP_CHUNK_SIZE, cancel_event=None):
+        """Initialize the stream from a Response opened with ``stream=True``."""
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._leftover = memoryview(b"")
+        self._cancel_event = cancel_event
+
+    def readable(self):
+        """Return True, this stream is always readable."""
+        return True
+
+    def readinto(self, b):
+        """Read up to len(b) bytes into b, returning 0 at the end of the stream."""
+        while not self._leftover:
+            _raise_if_cancelled(self._cancel_event)
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._leftover = memoryview(chunk)
+        nbytes = min(len(b), len(self._leftover))
+        b[:nbytes] = self._leftover[:nbytes]
+        self._leftover = self._leftover[nbytes:]
+        return nbytes
+
+
+def _raise_if_cancelled(cancel_event):
+    """Raise KeyboardInterrupt if cancel_event has been set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise KeyboardInterrupt("Test dataset install was interrupted.")
+
+
+def open_http_stream(response, buffer_size=HTTP_CHUNK_SIZE, cancel_event=None):
+    """Return a buffered, file-like reader over a streamed requests Response.
+
+    Parameters
+    ----------
+    response: Requests Response Object
+        - A GET Response retrieved with ``stream=True``
+    buffer_size: int, optional
+        - Size in bytes of both the HTTP chunks and the read buffer
+    cancel_event: threading.Event, optional
+        - If set while streaming, the next read raises KeyboardInterrupt
+
+    Returns
+    -------
+    io.BufferedReader
+        - File-like object suitable for ``open_tar_stream``
+    """
+    return io.BufferedReader(
+        _BufferedHTTPStream(
+            response, chunk_size=buffer_size, cancel_event=cancel_event
+        ),
+        buffer_size=buffer_size,
+    )
+
+
+def open_tar_stream(fileobj):
+    """Open a streamed (non-seekable) tar archive for reading.
+
+    Gzip compressed archives are decompressed with ISA-L (python-isal) when it is
+    installed, which is considerably faster than zlib. Otherwise, the compression is
+    detected and handled by tarfile itself (gzip, bzip2, xz or uncompressed).
+
+    Parameters
+    ----------
+    fileobj: io.BufferedReader
+        - Buffered file-like object over the archive, such as returned by
+          ``open_http_stream``
+
+    Returns
+    -------
+    tarfile.TarFile
+        - Tar archive opened in stream mode
+    """
+    if igzip is not None and fileobj.peek(2)[:2] == GZIP_MAGIC:
+        return tarfile.open(fileobj=igzip.IGzipFile(fileobj=fileobj), mode="r|")
+    return tarfile.open(fileobj=fileobj, mode="r|*")
+
+
+def _filter_member(member, dest_path):
+    """Return a copy of member which is safe to extract under dest_path.
+
+    Uses tarfile's 'data' extraction filter where available, which rejects absolute
+    paths, members (and link targets) resolving outside of dest_path, and strips
+    unsafe permission bits. Older Pythons without the filter fall back to checking
+    that the member's resolved path is contained within dest_path.
+
+    'dest_path' is expected to already be normalized via os.path.realpath, so that
+    it is only resolved once per archive rather than once per member.
+
+    Raises
+    ------
+    tarfile.TarError
+        If member would be extracted outside of dest_path.
+    """
+    if hasattr(tarfile, "data_filter"):
+        return tarfile.data_filter(member, dest_path)
+    candidate = realpath(join(dest_path, member.name))
+    if candidate != dest_path and not candidate.startswith(dest_path + os.sep):
+        raise tarfile.TarError(f"'{member.name}' is outside of {dest_path}")
+    return member
+
+
+class _ParallelMemberWriter:
+    """Write extracted tar members to disk using a bounded pool of threads.
+
+    Member contents are read from the (single pass) tar stream by the caller and
+    handed to ``submit``; the open / write / close / utime calls are then fanned out
+    across ``max_workers`` threads. At most ``2 * max_workers`` members, totalling at
+    most ``max_buffered`` bytes, are held in memory at once. Members too large to
+    buffer are streamed to disk on the calling thread with ``write``. Each unique
+    parent directory is only created a single time.
+
+    The first failed write is raised from the next call to ``submit`` or ``write``,
+    rather than only once the whole archive has been read.
+    """
+
+    def __init__(self, max_workers=EXTRACT_WORKERS, max_buffered=EXTRACT_BUFFER_SIZE):
+        """Initialize the writer's thread pool, memory budget and directory cache."""
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_pending = 2 * max_workers
+        self._max_buffered = max_buffered
+        self._pending = 0
+        self._buffered = 0
+        self._error = None
+        self._budget = Condition()
+        self._dir_lock = Lock()
+        self._created_dirs = set()
+
+    def __enter__(self):
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Wait for all pending writes, raising the first failure if any."""
+        self._pool.shutdown(wait=True, cancel_futures=exc_type is not None)
+        if exc_type is None:
+            self._raise_if_failed()
+
+    def makedirs(self, path):
+        """Create directory 'path' (and its parents) unless already created."""
+        with self._dir_lock:
+            if path in self._created_dirs:
+                return
+            makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def submit(self, path, data, mode, mtime):
+        """Queue 'data' to be written to 'path', blocking while the queue is full."""
+        size = len(data)
+        with self._budget:
+            # Always admit a member when nothing is pending, so that progress is made
+            # even if max_buffered is smaller than a single member.
+            self._budget.wait_for(
+                lambda: self._error is not None
+                or self._pending == 0
+                or (
+                    self._pending < self._max_pending
+                    and self._buffered + size <= self._max_buffered
+                )
+            )
+            self._raise_if_failed()
+            self._pending += 1
+            self._buffered += size
+        future = self._pool.submit(self._write, path, data, mode, mtime)
+        future.add_done_callback(lambda f: self._release(f, size))
+
+    def write(self, path, fileobj, mode, mtime):
+        """Stream 'fileobj' to 'path' on the calling thread, without buffering it."""
+        self._raise_if_failed()
+        self._write(path, fileobj, mode, mtime)
+
+    def _release(self, future, size):
+        """Return a finished write's share of the budget, recording any failure."""
+        with self._budget:
+            self._pending -= 1
+            self._buffered -= size
+            if self._error is None and not future.cancelled():
+                self._error = future.exception()
+            self._budget.notify_all()
+
+    def _raise_if_failed(self):
+        """Raise the first exception raised by a queued write, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def _write(self, path, data, mode, mtime):
+        """Write a single member's contents and restore its mode and mtime.
+
+        Works directly on the file descriptor so that mode and mtime are set without
+        resolving 'path' again, and without the extra syscalls made when setting up
+        a buffered Python file object. 'data' is either bytes, or a file object which
+        is copied in HTTP_CHUNK_SIZE pieces.
+        """
+        self.makedirs(dirname(path))
+        fd = os.open(path, _WRITE_FLAGS, mode)
+        try:
+            if isinstance(data, bytes):
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+            else:
+                with open(fd, "wb", buffering=0, closefd=False) as f:
+                    copyfileobj(data, f, HTTP_CHUNK_SIZE)
+            # Mode passed to os.open is masked by the umask, so set it explicitly
+            os.fchmod(fd, mode)
+            utime(fd, (mtime, mtime))
+        finally:
+            os.close(fd)
 
 
 class GeoipsConfigInstall(GeoipsExecutableCommand):
@@ -33,41 +290,209 @@ class GeoipsConfigInstall(GeoipsExecutableCommand):
             self._geoips_testdata_dir = environ["GEOIPS_TESTDATA_DIR"]
         return self._geoips_testdata_dir
 
+    @property
+    def cancel_event(self):
+        """Event set to interrupt test dataset installs running in other threads."""
+        if not hasattr(self, "_cancel_event"):
+            self._cancel_event = Event()
+        return self._cancel_event
+
     def add_arguments(self):
         """Add arguments to the config-subparser for the Config Command."""
         self.parser.add_argument(
             "test_dataset_name",
             type=str.lower,
-            choices=list(test_dataset_dict.keys()),
-            help="GeoIPS Test Dataset to Install.",
+            nargs="+",
+            choices=test_dataset_names + ("all",),
+            help=(
+                "GeoIPS Test Dataset[s] to Install. Use 'all' to install every "
+                "available test dataset."
+            ),
+        )
+        self.parser.add_argument(
+            "--resumable",
+            "-r",
+            default=False,
+            action="store_true",
+            help=(
+                "Download each archive to "
+                "GEOIPS_TESTDATA_DIR/<test_dataset_name>.tgz.part before extracting "
+                "it, resuming any partial download left by a previous attempt. Trades "
+                "disk space for not re-downloading data."
+            ),
         )
 
     def __call__(self, args):
-        """Run the `geoips config install <test_dataset_name>` command.
+        """Run the `geoips config install <test_dataset_name> ...` command.
+
+        Multiple test datasets are downloaded and extracted concurrently, sharing a
+        single pooled HTTP session. If any dataset fails, those not yet started are
+        cancelled, every failure is reported, and the first failure is re-raised. On
+        Ctrl-C, cancel_event is set so that running installs stop and clean up.
 
         Parameters
         ----------
         args: Namespace()
             - The argument namespace to parse through
         """
-        test_dataset_name = args.test_dataset_name
-        test_dataset_url = test_dataset_dict[test_dataset_name]
-        if any([test_dataset_name in fol for fol in listdir(self.geoips_testdata_dir)]):
-            print(
-                f"Test dataset '{test_dataset_name}' already exists under "
-                f"'{join(self.geoips_testdata_dir, test_dataset_name)}*/'. See that "
-                "location for the contents of the test dataset."
-            )
+        if "all" in args.test_dataset_name:
+            requested = test_dataset_names
         else:
+            # Drop duplicates while preserving the order requested
+            requested = tuple(dict.fromkeys(args.test_dataset_name))
+        to_install = []
+        for test_dataset_name in requested:
+            if isdir(join(self.geoips_testdata_dir, test_dataset_name)):
+                print(
+                    f"Test dataset '{test_dataset_name}' already exists under "
+                    f"'{join(self.geoips_testdata_dir, test_dataset_name)}/'. See that "
+                    "location for the contents of the test dataset."
+                )
+            else:
+                to_install.append(test_dataset_name)
+        if not to_install:
+            return
+
+        with requests.Session() as session:
+            # Every dataset is hosted on the same server, so allow one pooled
+            # connection per dataset being downloaded.
+            adapter = HTTPAdapter(pool_maxsize=len(to_install))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            if len(to_install) == 1:
+                # Nothing to run concurrently, keep Ctrl-C in the installing thread
+                self.install_test_dataset(to_install[0], session, args.resumable)
+                return
+            self._cancel_event = Event()
+            with ThreadPoolExecutor(
+                max_workers=min(DOWNLOAD_WORKERS, len(to_install))
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        self.install_test_dataset, name, session, args.resumable
+                    ): name
+                    for name in to_install
+                }
+                try:
+                    wait(futures, return_when=FIRST_EXCEPTION)
+                except KeyboardInterrupt:
+                    # Worker threads never see Ctrl-C, tell running installs to stop
+                    self.cancel_event.set()
+                    raise
+                finally:
+                    # Don't start any datasets still queued once one has failed, but
+                    # let those already running finish so that their failures (or
+                    # cleanup after being interrupted) are seen.
+                    pool.shutdown(wait=True, cancel_futures=True)
+        failed = [
+            future
+            for future in futures
+            if not future.cancelled() and future.exception() is not None
+        ]
+        for future in failed:
             print(
-                f"Installing {test_dataset_name} test dataset. This may take a while..."
+                f"Failed to install test dataset '{futures[future]}': "
+                f"{future.exception()!r}"
             )
-            self.download_extract_test_data(test_dataset_url, self.geoips_testdata_dir)
-            out_str = f"Test dataset '{test_dataset_name}' has been installed under "
-            out_str += f"{self.geoips_testdata_dir}/{test_dataset_name}/"
-            print(out_str)
+        if failed:
+            failed[0].result()
+
+    def install_test_dataset(
+        self, test_dataset_name, session=requests, resumable=False
+    ):
+        """Download and extract a single test dataset into GEOIPS_TESTDATA_DIR.
+
+        The archive is extracted into a staging directory,
+        GEOIPS_TESTDATA_DIR/<test_dataset_name>.partial, and only moved into place
+        once the whole archive has been extracted successfully. A failed or
+        interrupted install therefore never leaves behind a half populated
+        <test_dataset_name> directory that would be mistaken for an installed dataset.
 
-    def download_extract_test_data(self, url, download_dir):
+        Parameters
+        ----------
+        test_dataset_name: str
+            - The name of the test dataset to install
+        session: requests.Session, optional
+            - Session used to download the dataset, defaults to the requests module
+        resumable: bool, optional
+            - If True, download the archive to disk (resuming a partial download if
+              one exists) before extracting it, rather than streaming the extraction.
+        """
+        print(f"Installing {test_dataset_name} test dataset. This may take a while...")
+        url = test_dataset_dict[test_dataset_name]
+        staging_dir = join(self.geoips_testdata_dir, f"{test_dataset_name}.partial")
+        if exists(staging_dir):
+            # Left over from a previous failed install
+            rmtree(staging_dir)
+        makedirs(staging_dir)
+        try:
+            if resumable:
+                archive_path = join(
+                    self.geoips_testdata_dir, f"{test_dataset_name}.tgz.part"
+                )
+                self.download_resumable(url, archive_path, session=session)
+                try:
+                    with open(archive_path, "rb", buffering=HTTP_CHUNK_SIZE) as archive:
+                        self.extract_archive_cautiously(archive, staging_dir)
+                except (Exception, SystemExit):
+                    # The download is complete but can't be extracted (ie. corrupt
+                    # or unsafe), so download it again next time, not resume it.
+                    # Kept on Ctrl-C, as the archive itself may be fine.
+                    for path in (archive_path, f"{archive_path}.validator"):
+                        if exists(path):
+                            remove(path)
+                    raise
+            else:
+                self.download_extract_test_data(url, staging_dir, session=session)
+            self.promote_staged_dataset(staging_dir, self.geoips_testdata_dir)
+        except BaseException:
+            # Includes SystemExit raised for unsafe members and argparse errors
+            rmtree(staging_dir, ignore_errors=True)
+            raise
+        if resumable:
+            remove(archive_path)
+            if exists(f"{archive_path}.validator"):
+                remove(f"{archive_path}.validator")
+        out_str = f"Test dataset '{test_dataset_name}' has been installed under "
+        out_str += f"{self.geoips_testdata_dir}/{test_dataset_name}/"
+        print(out_str)
+
+    def promote_staged_dataset(self, staging_dir, download_dir):
+        """Move the contents of a fully extracted staging_dir into download_dir.
+
+        Each top-level entry of the archive (normally the single test dataset
+        directory) is moved individually with os.rename, so entries never appear
+        half extracted. Nothing is moved if any entry already exists in
+        download_dir, and entries already moved are moved back if a later rename
+        fails. staging_dir is removed afterwards.
+
+        Parameters
+        ----------
+        staging_dir: str
+            - The directory the archive was extracted into
+        download_dir: str
+            - The directory the extracted contents are moved into
+        """
+        with scandir(staging_dir) as entries:
+            names = sorted(entry.name for entry in entries)
+        existing = [name for name in names if lexists(join(download_dir, name))]
+        if existing:
+            self.parser.error(
+                f"Can't install test data, {existing} already exist under "
+                f"{download_dir}. Remove them and try again."
+            )
+        moved = []
+        try:
+            for name in names:
+                rename(join(staging_dir, name), join(download_dir, name))
+                moved.append(name)
+        except BaseException:
+            for name in moved:
+                rename(join(download_dir, name), join(staging_dir, name))
+            raise
+        rmdir(staging_dir)
+
+    def download_extract_test_data(self, url, download_dir, session=requests):
         """Download the specified URL and write it to the corresponding download_dir.
 
         Will extract the data using tarfile and create an archive by bundling the
@@ -79,14 +504,83 @@ class GeoipsConfigInstall(GeoipsExecutableCommand):
             - The url of the test dataset to download
         download_dir: str
             - The directory in which to download and extract the data into
+        session: requests.Session, optional
+            - Session used to download the data, so connections can be reused across
+              downloads. Defaults to the requests module.
         """
-        resp = requests.get(url, stream=True, timeout=15)
-        if resp.status_code == 200:
-            self.extract_data_cautiously(resp, download_dir)
-        else:
-            self.parser.error(
-                f"Error retrieving data from {url}; Status Code {resp.status_code}."
-            )
+        with session.get(url, stream=True, timeout=15) as resp:
+            if resp.status_code == 200:
+                self.extract_data_cautiously(resp, download_dir)
+            else:
+                self.parser.error(
+                    f"Error retrieving data from {url}; Status Code {resp.status_code}."
+                )
+
+    def download_resumable(self, url, archive_path, session=requests):
+        """Download url to archive_path, resuming a previous partial download.
+
+        The ETag (or Last-Modified) validator of the response is saved alongside the
+        download as '<archive_path>.validator'. If archive_path already holds part of
+        the file, only the remaining bytes are requested via an HTTP 'Range' header,
+        along with an 'If-Range' header containing the saved validator. If the file
+        changed on the server since the partial download, the server sends the whole
+        file again (200) instead of the remainder (206), and archive_path is rewritten
+        from the start. A 416 response whose Content-Range matches the size of
+        archive_path means the download had already completed.
+
+        Parameters
+        ----------
+        url: str
+            - The url of the file to download
+        archive_path: str
+            - Path to download the file to
+        session: requests.Session, optional
+            - Session used to download the data, defaults to the requests module
+        """
+        validator_path = f"{archive_path}.validator"
+        headers = {}
+        if exists(archive_path) and exists(validator_path):
+            with open(validator_path, "r") as f:
+                validator = f.read()
+            headers = {
+                "Range": f"bytes={getsize(archive_path)}-",
+                "If-Range": validator,
+            }
+        with session.get(url, stream=True, timeout=15, headers=headers) as resp:
+            if resp.status_code == 416 and headers:
+                # The range starts at or past the end of the file. As the validator
+                # still matched (otherwise the whole file is sent), a partial file
+                # the same size as the file on the server is already complete.
+                content_range = resp.headers.get("Content-Range", "")
+                if content_range == f"bytes */{getsize(archive_path)}":
+                    return
+                # Otherwise the partial file can't be resumed (ie. it is larger than
+                # the file on the server), start over from scratch.
+                for path in (archive_path, validator_path):
+                    if exists(path):
+                        remove(path)
+                return self.download_resumable(url, archive_path, session=session)
+            if resp.status_code not in (200, 206):
+                self.parser.error(
+                    f"Error retrieving data from {url}; Status Code {resp.status_code}."
+                )
+            if resp.status_code == 200:
+                # Full content, (re)start the download and record how to resume it
+                mode = "wb"
+                validator = resp.headers.get("ETag") or resp.headers.get(
+                    "Last-Modified"
+                )
+                if validator:
+                    with open(validator_path, "w") as f:
+                        f.write(validator)
+                elif exists(validator_path):
+                    remove(validator_path)
+            else:
+                mode = "ab"
+            with open(archive_path, mode) as archive:
+                for chunk in resp.iter_content(chunk_size=HTTP_CHUNK_SIZE):
+                    _raise_if_cancelled(self.cancel_event)
+                    archive.write(chunk)
 
     def extract_data_cautiously(self, response, download_dir):
         """Extract the GET Response cautiously and skip any dangerous members.
@@ -98,6 +592,10 @@ class GeoipsConfigInstall(GeoipsExecutableCommand):
         maneuvering characters could be invoked ('../', ...), which we will not allow
         when downloading test data.
 
+        Only directories and regular files are extracted; links, devices and other
+        special members are skipped. File contents are written to disk concurrently
+        via a bounded pool of threads while the archive continues to stream.
+
         Parameters
         ----------
         response: Requests Response Object
@@ -105,12 +603,45 @@ class GeoipsConfigInstall(GeoipsExecutableCommand):
         download_dir: str
             - The directory in which to download and extract the data into
         """
-        with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
+        self.extract_archive_cautiously(
+            open_http_stream(response, cancel_event=self.cancel_event), download_dir
+        )
+
+    def extract_archive_cautiously(self, fileobj, download_dir):
+        """Extract a tar archive read from fileobj, skipping any dangerous members.
+
+        See ``extract_data_cautiously`` for how members are validated and written.
+
+        Parameters
+        ----------
+        fileobj: io.BufferedReader
+            - Buffered file-like object to stream the tar archive from
+        download_dir: str
+            - The directory in which to download and extract the data into
+        """
+        with (
+            open_tar_stream(fileobj) as tar,
+            _ParallelMemberWriter() as writer,
+        ):
+            # Resolve download_dir once, rather than for every member of the archive
+            download_dir = realpath(download_dir)
             # Validate and extract each member of the archive
             for m in tar:
-                if not abspath(join(download_dir, m.name)).startswith(download_dir):
+                _raise_if_cancelled(self.cancel_event)
+                if not (m.isdir() or m.isfile()):
+                    continue
+                try:
+                    m = _filter_member(m, download_dir)
+                except tarfile.TarError:
                     raise SystemExit("Found unsafe filepath in tar, exiting now.")
-                tar.extract(m, path=download_dir)
+                path = join(download_dir, m.name)
+                if m.isdir():
+                    writer.makedirs(path)
+                elif m.size >= LARGE_MEMBER_SIZE:
+                    writer.write(path, tar.extractfile(m), m.mode & 0o777, m.mtime)
+                else:
+                    data = tar.extractfile(m).read()
+                    writer.submit(path, data, m.mode & 0o777, m.mtime)
 
 
 class GeoipsConfig(GeoipsCommand):
@@ -9,13 +9,13 @@ Lists the appropriate interfaces/packages/plugins based on the arguments provide
 from glob import glob
 from importlib import metadata, resources, import_module
 import json
-from os import listdir
-from os.path import basename
+from os import scandir
+from os.path import basename, isdir
 import sys
 
 from tabulate import tabulate
 
-from geoips.commandline.ancillary_info.test_data import test_dataset_dict
+from geoips.commandline.ancillary_info.test_data import test_dataset_names
 from geoips.commandline.geoips_command import (
     CommandClassFactory,
     GeoipsCommand,
@@ -180,9 +180,7 @@ class GeoipsListUnitTests(GeoipsExecutableCommand):
                     f"Package '{pkg_name}' isn't installed in editable mode."
                 )
             unit_test_dir = str(resources.files(pkg_name) / "../tests/unit_tests")
-            try:
-                listdir(unit_test_dir)
-            except FileNotFoundError:
+            if not isdir(unit_test_dir):
                 if len(package_names) == 1:
                     err_str = f"No unit test directory found under {pkg_name}. "
                     err_str += "Please create a tests/unit_tests folder for that "
@@ -191,7 +189,12 @@ class GeoipsListUnitTests(GeoipsExecutableCommand):
                 else:
                     print(f"No unit tests found in '{pkg_name}', continuing.")
                     continue
-            for subdir_name in listdir(unit_test_dir):
+            # scandir entries carry their file type, so only subdirectories are
+            # globbed, without a stat call per entry
+            subdir_names = [
+                entry.name for entry in scandir(unit_test_dir) if entry.is_dir()
+            ]
+            for subdir_name in subdir_names:
                 for unit_test in sorted(
                     glob(f"{unit_test_dir}/{subdir_name}/test*.py")
                 ):  # noqa
@@ -252,7 +255,7 @@ class GeoipsListTestDatasets(GeoipsExecutableCommand):
         dataset_info = []
         default_headers = {"data_host": "Data Host", "dataset_name": "Dataset Name"}
         headers = self._get_headers_by_command(args, default_headers)
-        for test_dataset_name in list(test_dataset_dict.keys()):
+        for test_dataset_name in test_dataset_names:
             dataset_entry = []
             for header in list(headers.keys()):
                 if header == "data_host":
@@ -6,12 +6,12 @@
 Runs the appropriate tests based on the arguments provided.
 """
 
-from glob import glob
+from functools import lru_cache
 from importlib import resources
 
 # from os import listdir
 from os import environ, makedirs
-from os.path import basename, exists, join
+from os.path import exists, join
 import sys
 
 # from pytest import main as invoke_pytest
@@ -23,6 +23,46 @@ from geoips.geoips_utils import is_editable
 from geoips.interfaces import sectors
 
 
+@lru_cache(maxsize=None)
+def _scripts_for(package_name, dir_name):
+    """Return the test scripts found under <package_name>/tests/<dir_name>.
+
+    Cached per (package_name, dir_name) so repeated invocations within the same
+    process don't re-scan script directories containing hundreds of files.
+
+    The tests directory sits beside the package rather than inside it, so this relies
+    on the package being installed on the filesystem (ie. an editable install), where
+    resources.files returns a pathlib.Path which supports '.parent'.
+
+    Parameters
+    ----------
+    package_name: str
+        - The GeoIPS package to search for test scripts.
+    dir_name: str
+        - The directory under <package_name>/tests, ie. 'scripts' or
+          'integration_tests'.
+
+    Returns
+    -------
+    test_dir: str
+        - String path to the directory containing the test scripts.
+    script_names: tuple of str
+        - Sorted basenames of each '.sh' script, used for error messages.
+    script_set: frozenset of str
+        - The same basenames, used for membership tests.
+    """
+    test_dir = resources.files(package_name).parent / "tests" / dir_name
+    if test_dir.is_dir():
+        script_names = tuple(
+            sorted(
+                fpath.name for fpath in test_dir.iterdir() if fpath.name.endswith(".sh")
+            )
+        )
+    else:
+        script_names = ()
+    return str(test_dir), script_names, frozenset(script_names)
+
+
 # class GeoipsTestUnitTest(GeoipsExecutableCommand):
 #     """Test Command for running GeoIPS Unit Tests."""
 
@@ -255,10 +295,9 @@ class GeoipsTestScript(GeoipsExecutableCommand):
             raise RuntimeError(
                 f"Package '{package_name}' isn't installed in editable mode."
             )
-        test_dir = str(resources.files(package_name) / f"../tests/{dir_name}")
-        fnames = [basename(fpath) for fpath in glob(f"{test_dir}/*.sh")]
+        test_dir, fnames, fname_set = _scripts_for(package_name, dir_name)
 
-        if script_name not in fnames:
+        if script_name not in fname_set:
             # Raise an argparse error which states that file doesn't exist within the
             # specified directory
             str_fnames = ",\n".join(fnames)
@@ -7,16 +7,39 @@ Validates the appropriate plugin based on the arguments provided using the assoc
 interface's validation mechaninism (interface.plugin_is_valid(plugin_name)).
 """
 
+from functools import lru_cache
+from hashlib import blake2b
 from importlib.util import spec_from_file_location, module_from_spec
-from os.path import exists
+from os import stat
+from os.path import abspath, exists
 from pathlib import Path
 
 import yaml
 
+try:
+    # Use the libyaml-backed C loader where PyYAML was built against libyaml
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from geoips.commandline.geoips_command import GeoipsExecutableCommand
 from geoips import interfaces
 
 
+@lru_cache(maxsize=256)
+def _load_module_cached(abs_path, mtime_ns, module_name):
+    """Load and execute the python module found at abs_path.
+
+    Cached on (abs_path, mtime_ns, module_name) so validating the same, unmodified
+    plugin again reuses the already executed module. 'mtime_ns' is only used as part
+    of the cache key, so that edits to the file are picked up.
+    """
+    spec = spec_from_file_location(module_name, abs_path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class GeoipsValidate(GeoipsExecutableCommand):
     """Validate Command for validating package plugins."""
 
@@ -79,21 +102,24 @@ class GeoipsValidate(GeoipsExecutableCommand):
         elif fpath.suffix == ".yaml":
             # yaml-based plugin
             interface_type = "yaml_based"
-            plugin = yaml.safe_load(open(fpath, "r"))
+            with open(fpath, "rb") as f:
+                plugin = yaml.load(f, Loader=SafeLoader)
         else:
             self.parser.error(
                 "Only '.py' and '.yaml' files are accepted at this time. Try again."
             )
-        try:
-            # if the module / yaml plugin is missing either interface or name, it's
-            # invalid and we need to report the error appropriately
-            if interface_type == "module_based":
-                interface_name = plugin.interface
-                plugin_name = plugin.name
-            else:
-                interface_name = plugin["interface"]
-                plugin_name = plugin["name"]
-        except AttributeError or KeyError:
+        # if the module / yaml plugin is missing either interface or name, it's
+        # invalid and we need to report the error appropriately
+        if interface_type == "module_based":
+            interface_name = getattr(plugin, "interface", None)
+            plugin_name = getattr(plugin, "name", None)
+        elif isinstance(plugin, dict):
+            interface_name = plugin.get("interface")
+            plugin_name = plugin.get("name")
+        else:
+            # Empty or non-mapping yaml file
+            interface_name = plugin_name = None
+        if interface_name is None or plugin_name is None:
             # Report such error.
             err_str = f"Plugin found at {fpath} doesn't have 'interface' and/or "
             err_str += "'name' attribute[s]. This plugin is invalid."
@@ -104,17 +130,12 @@ class GeoipsValidate(GeoipsExecutableCommand):
 
     def _load_module_from_file(self, file_path, module_name=None):
         """Load in a given python module provied a file_path and an optional name."""
+        abs_path = abspath(file_path)
         if module_name is None:
             # Generate a unique module name if not provided
-            module_name = "module_from_"
-            module_name += (
-                str(file_path).replace("/", "_").replace(".", "_").replace("\\", "_")
-            )
-
-        spec = spec_from_file_location(module_name, file_path)
-        module = module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
+            digest = blake2b(abs_path.encode(), digest_size=8).hexdigest()
+            module_name = f"module_from_{digest}"
+        return _load_module_cached(abs_path, stat(abs_path).st_mtime_ns, module_name)
 
     def validate_sub_products(self, interface, fpath, plugin):
         """Validate each sub-product plugin found within a products yaml definition.
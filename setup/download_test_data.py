@@ -4,6 +4,7 @@
 # # # https://github.com/NRLMMD-GEOIPS.
 
 """Download data from a specified URL."""
+import io
 import subprocess
 import requests
 import tarfile
@@ -12,6 +13,42 @@ import os
 
 import yaml
 
+# Size of each block pulled off of the HTTP socket while streaming archives.
+HTTP_CHUNK_SIZE = 1024 * 1024
+
+
+# Kept in sync with geoips.commandline.geoips_config._BufferedHTTPStream; this script
+# must run standalone, before geoips itself is installed.
+class BufferedHTTPStream(io.RawIOBase):
+    """Raw, read-only file object over a streamed requests Response.
+
+    Pulls ``chunk_size`` blocks from ``response.iter_content`` and hands them out
+    through ``readinto``, so it can be wrapped in an ``io.BufferedReader`` and passed
+    to ``tarfile.open(fileobj=...)`` instead of the much smaller reads made against
+    ``response.raw``.
+    """
+
+    def __init__(self, response, chunk_size=HTTP_CHUNK_SIZE):
+        """Initialize the stream from a Response opened with ``stream=True``."""
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._leftover = memoryview(b"")
+
+    def readable(self):
+        """Return True, this stream is always readable."""
+        return True
+
+    def readinto(self, b):
+        """Read up to len(b) bytes into b, returning 0 at the end of the stream."""
+        while not self._leftover:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._leftover = memoryview(chunk)
+        nbytes = min(len(b), len(self._leftover))
+        b[:nbytes] = self._leftover[:nbytes]
+        self._leftover = self._leftover[nbytes:]
+        return nbytes
+
 
 def get_argparse_formatter():
     """
@@ -133,6 +170,47 @@ def download_from_git(repo_url, destination):
         raise e
 
 
+# Let tarfile re-apply the 'data' filter on extraction where it is available
+EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def safe_member(member, dest):
+    """
+    Return a version of a tar member which is safe to extract under dest.
+
+    Uses tarfile's 'data' extraction filter where available, which rejects absolute
+    paths, members resolving outside of ``dest`` (including through symbolic links
+    extracted earlier) and links pointing outside of ``dest``. Pythons without the
+    filter skip links entirely and check that the member's resolved path is
+    contained within ``dest``.
+
+    Parameters
+    ----------
+    member : tarfile.TarInfo
+        The archive member to check.
+    dest : str
+        The absolute path of the directory being extracted into.
+
+    Returns
+    -------
+    tarfile.TarInfo or None
+        The member to extract, or None if it should be skipped.
+
+    Raises
+    ------
+    tarfile.TarError
+        If the member would be extracted outside of ``dest``.
+    """
+    if hasattr(tarfile, "data_filter"):
+        return tarfile.data_filter(member, dest)
+    if member.issym() or member.islnk():
+        return None
+    target = os.path.realpath(os.path.join(dest, member.name))
+    if os.path.commonpath([os.path.realpath(dest), target]) != os.path.realpath(dest):
+        raise tarfile.TarError(f"'{member.name}' is outside of {dest}")
+    return member
+
+
 def download_and_extract_compressed_tar(url, dest, comp="gz"):
     """
     Download a compressed tar file from a URL and extract its contents.
@@ -142,6 +220,11 @@ def download_and_extract_compressed_tar(url, dest, comp="gz"):
     and extracts the files directly to the specified destination directory.
     It does this in memory in chunks to prevent a memory overflow on large files and
     for a speed increase by never having to re-read data off of slower non-RAM memory.
+    The archive itself is never written to disk; members are extracted as they are
+    decompressed from the HTTP response.
+
+    Any member whose path, or link target, would resolve outside of ``dest`` aborts
+    the extraction.
 
     Parameters
     ----------
@@ -149,8 +232,7 @@ def download_and_extract_compressed_tar(url, dest, comp="gz"):
         The URL of the compressed tar file to download
     dest : str
         The directory where the contents of the tar file should be extracted.
-        If the directory does not exist,
-        it should be created prior to calling this function.
+        If the directory does not exist, it will be created.
     comp : str, optional
         The compression type used in the tar file. Accepted values include:
         - "gz" for gzip compression (default).
@@ -161,21 +243,38 @@ def download_and_extract_compressed_tar(url, dest, comp="gz"):
     Returns
     -------
     None
+
+    Raises
+    ------
+    ValueError
+        If the archive contains a member that would be extracted outside of ``dest``.
     """
     output_to_console(
         f"Downloading and extracting {url} to {dest}...", style="bold cyan"
     )
+    dest = os.path.abspath(dest)
     try:
+        os.makedirs(dest, exist_ok=True)
         with requests.get(url, stream=True, timeout=360) as r:
             r.raise_for_status()
             file_length = int(r.headers.get("content-length", 0))
-            with tarfile.open(fileobj=r.raw, mode=f"r|{comp}") as tar:
+            stream = io.BufferedReader(
+                BufferedHTTPStream(r), buffer_size=HTTP_CHUNK_SIZE
+            )
+            with tarfile.open(fileobj=stream, mode=f"r|{comp}") as tar:
                 output_to_console(
                     f"File is {sizeof_fmt(file_length)}... ",
                     style="cyan",
                 )
-                # Trusting archives to not be malicious by not filtering files
-                tar.extractall(path=dest)  # nosec
+                for member in tar:
+                    try:
+                        member = safe_member(member, dest)
+                    except tarfile.TarError as err:
+                        raise ValueError(
+                            f"Refusing to extract '{member.name}' outside of {dest}"
+                        ) from err
+                    if member is not None:
+                        tar.extract(member, path=dest, **EXTRACT_KWARGS)
         output_to_console("Success. Files downloaded and extracted.", style="green")
     except Exception as e:
         output_to_console("Failed to download or extract files.", style="bold red")
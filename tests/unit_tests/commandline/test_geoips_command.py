@@ -0,0 +1,43 @@
+# # # This source code is protected under the license referenced at
+# # # https://github.com/NRLMMD-GEOIPS.
+
+"""Unit tests for geoips/commandline/geoips_command.py.
+
+Tests the ArgumentChoices container used for argparse 'choices'.
+"""
+
+import pytest
+
+from geoips.commandline.commandline_interface import GeoipsCLI
+from geoips.commandline.geoips_command import ArgumentChoices, plugin_packages
+
+
+def test_argument_choices_contains():
+    """Ensure membership is backed by the frozenset, and unhashables are rejected."""
+    choices = ArgumentChoices(["geoips", "data_fusion", "recenter_tc"])
+    assert choices._choice_set == frozenset(choices)
+    assert "data_fusion" in choices
+    assert "not_a_package" not in choices
+    assert ["geoips"] not in choices
+    assert {"geoips": 1} not in choices
+
+
+def test_argument_choices_tuple_like():
+    """Ensure ordering, iteration and repr match the equivalent tuple."""
+    names = ["recenter_tc", "geoips", "data_fusion"]
+    choices = ArgumentChoices(names)
+    assert isinstance(choices, tuple)
+    assert list(choices) == names
+    assert choices == tuple(names)
+    assert repr(choices) == repr(tuple(names))
+    assert ArgumentChoices() == ()
+
+
+def test_argument_choices_invalid_choice(capsys):
+    """Ensure argparse still lists every choice, in order, for an invalid value."""
+    with pytest.raises(SystemExit):
+        GeoipsCLI().parser.parse_args(["list", "plugins", "-p", "bad_pkg"])
+    error = capsys.readouterr().err
+    assert "invalid choice: 'bad_pkg'" in error
+    listing = ", ".join(repr(name) for name in plugin_packages.entrypoints)
+    assert f"(choose from {listing})" in error
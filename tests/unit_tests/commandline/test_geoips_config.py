@@ -0,0 +1,477 @@
+# # # This source code is protected under the license referenced at
+# # # https://github.com/NRLMMD-GEOIPS.
+
+"""Unit tests for geoips/commandline/geoips_config.py.
+
+Tests the helpers used by `geoips config install` to stream and extract test datasets
+without reaching out to the network.
+"""
+
+import io
+import os
+import tarfile
+import threading
+import time
+
+import pytest
+
+from geoips.commandline.commandline_interface import GeoipsCLI
+from geoips.commandline.ancillary_info.test_data import (
+    test_dataset_dict,
+    test_dataset_names,
+)
+from geoips.commandline import geoips_config
+from geoips.commandline.geoips_config import open_http_stream, open_tar_stream
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests Response."""
+
+    def __init__(self, content, chunk_size=7001, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {"content-length": str(len(content)), **(headers or {})}
+        self._chunk_size = chunk_size
+
+    def __enter__(self):
+        """Return the response for use as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Nothing to close."""
+
+    def iter_content(self, chunk_size=1):
+        """Yield the content in chunks which don't line up with tar blocks."""
+        for idx in range(0, len(self.content), self._chunk_size):
+            yield self.content[idx : idx + self._chunk_size]
+
+
+class FakeRangeSession:
+    """Stand-in for a requests Session serving content which supports HTTP ranges."""
+
+    def __init__(self, content, etag='"v1"'):
+        self.content = content
+        self.etag = etag
+        self.statuses = []
+
+    def get(self, url, headers=None, **kwargs):
+        """Return the remaining content if the range request is still valid."""
+        headers = headers or {}
+        if "Range" in headers and headers.get("If-Range") == self.etag:
+            offset = int(headers["Range"][len("bytes=") : -1])
+            if offset >= len(self.content):
+                resp = FakeResponse(
+                    b"",
+                    status_code=416,
+                    headers={"Content-Range": f"bytes */{len(self.content)}"},
+                )
+            else:
+                resp = FakeResponse(self.content[offset:], status_code=206)
+        else:
+            resp = FakeResponse(self.content, headers={"ETag": self.etag})
+        self.statuses.append(resp.status_code)
+        return resp
+
+
+def make_tgz(members, symlinks=None, comp="gz"):
+    """Return the bytes of a compressed tar archive containing members.
+
+    Parameters
+    ----------
+    members: dict
+        - Mapping of {"archive/path": bytes_content}
+    symlinks: dict, optional
+        - Mapping of {"archive/path": link_target}
+    comp: str, optional
+        - Compression used for the archive, '' for none
+    """
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode=f"w:{comp}") as tar:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+        for name, target in (symlinks or {}).items():
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.SYMTYPE
+            info.linkname = target
+            tar.addfile(info)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="module")
+def install_cmd():
+    """Instance of the GeoipsConfigInstall command, as built by the CLI."""
+    args = GeoipsCLI().parser.parse_args(["config", "install", "test_data_clavrx"])
+    return args.exe_command.__self__
+
+
+@pytest.fixture
+def testdata_dir(install_cmd, monkeypatch, tmp_path):
+    """Point install_cmd's GEOIPS_TESTDATA_DIR at tmp_path, and return tmp_path."""
+    monkeypatch.setattr(
+        install_cmd, "_geoips_testdata_dir", str(tmp_path), raising=False
+    )
+    return tmp_path
+
+
+def read_tree(root):
+    """Return {relative_path: bytes_content} for every file found under root."""
+    found = {}
+    for dirpath, _, fnames in os.walk(root):
+        for fname in fnames:
+            fpath = os.path.join(dirpath, fname)
+            with open(fpath, "rb") as f:
+                found[os.path.relpath(fpath, root)] = f.read()
+    return found
+
+
+@pytest.fixture
+def members():
+    """Archive members with a mix of small and multi-chunk files."""
+    return {
+        f"test_data_fake/data/file_{idx}.bin": bytes(range(256)) * (idx * 37 + 1)
+        for idx in range(20)
+    }
+
+
+@pytest.mark.parametrize("buffer_size", [512, 64 * 1024, 1024 * 1024])
+def test_open_http_stream_round_trip(members, buffer_size):
+    """Ensure the buffered HTTP stream yields the exact response content."""
+    content = make_tgz(members)
+    stream = open_http_stream(FakeResponse(content), buffer_size=buffer_size)
+    assert stream.read() == content
+
+
+def test_open_http_stream_tarfile(members):
+    """Ensure tarfile can stream an archive from the buffered HTTP stream."""
+    stream = open_http_stream(FakeResponse(make_tgz(members)))
+    with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+        found = {m.name: tar.extractfile(m).read() for m in tar}
+    assert found == members
+
+
+@pytest.mark.parametrize("use_isal", [True, False])
+@pytest.mark.parametrize("comp", ["gz", "xz", ""])
+def test_open_tar_stream(members, monkeypatch, use_isal, comp):
+    """Ensure archives are read with and without ISA-L, for each compression."""
+    if use_isal:
+        pytest.importorskip("isal")
+    else:
+        monkeypatch.setattr(geoips_config, "igzip", None)
+    stream = open_http_stream(FakeResponse(make_tgz(members, comp=comp)))
+    with open_tar_stream(stream) as tar:
+        found = {m.name: tar.extractfile(m).read() for m in tar}
+    assert found == members
+
+
+def test_extract_data_cautiously(install_cmd, members, tmp_path):
+    """Ensure every member is extracted with its contents intact."""
+    response = FakeResponse(make_tgz(members))
+    install_cmd.extract_data_cautiously(response, str(tmp_path))
+    assert read_tree(tmp_path) == members
+
+
+def test_extract_data_cautiously_skips_links(install_cmd, members, tmp_path):
+    """Ensure symbolic links found in the archive are not extracted."""
+    content = make_tgz(members, symlinks={"test_data_fake/link": "/etc/passwd"})
+    install_cmd.extract_data_cautiously(FakeResponse(content), str(tmp_path))
+    assert read_tree(tmp_path) == members
+    assert not os.path.lexists(tmp_path / "test_data_fake" / "link")
+
+
+@pytest.mark.parametrize(
+    "unsafe_name", ["../escaped.bin", "test_data_fake/../../escaped.bin"]
+)
+def test_extract_data_cautiously_unsafe_path(install_cmd, tmp_path, unsafe_name):
+    """Ensure members resolving outside of download_dir abort the extraction."""
+    download_dir = tmp_path / "testdata"
+    download_dir.mkdir()
+    response = FakeResponse(make_tgz({unsafe_name: b"unsafe"}))
+    with pytest.raises(SystemExit):
+        install_cmd.extract_data_cautiously(response, str(download_dir))
+    assert read_tree(tmp_path) == {}
+
+
+def test_extract_data_cautiously_large_members(
+    install_cmd, members, monkeypatch, tmp_path
+):
+    """Ensure members streamed straight to disk are extracted intact."""
+    monkeypatch.setattr(geoips_config, "LARGE_MEMBER_SIZE", 4096)
+    install_cmd.extract_data_cautiously(FakeResponse(make_tgz(members)), str(tmp_path))
+    assert read_tree(tmp_path) == members
+
+
+def test_member_writer_budget(tmp_path):
+    """Ensure the bytes buffered by the writer never exceed max_buffered."""
+    writer = geoips_config._ParallelMemberWriter(max_workers=4, max_buffered=100)
+    write, buffered = writer._write, []
+
+    def tracked_write(*args):
+        buffered.append(writer._buffered)
+        write(*args)
+
+    writer._write = tracked_write
+    expected = {f"file_{idx}.bin": bytes([idx]) * 40 for idx in range(20)}
+    with writer:
+        for name, data in expected.items():
+            writer.submit(str(tmp_path / name), data, 0o644, 0)
+    assert max(buffered) <= 100
+    assert read_tree(tmp_path) == expected
+
+
+def test_member_writer_fails_early(tmp_path):
+    """Ensure a failed write is raised by the next submit, not only on exit."""
+    (tmp_path / "blocker").write_bytes(b"")
+    # A budget of one byte forces the second submit to wait for the first write
+    writer = geoips_config._ParallelMemberWriter(max_workers=1, max_buffered=1)
+    with pytest.raises(OSError):
+        writer.submit(str(tmp_path / "blocker" / "a.bin"), b"a", 0o644, 0)
+        writer.submit(str(tmp_path / "b.bin"), b"b", 0o644, 0)
+    writer.__exit__(OSError, None, None)
+    assert not (tmp_path / "b.bin").exists()
+
+
+def test_install_existing_dataset(install_cmd, monkeypatch, testdata_dir, capsys):
+    """Ensure an already installed dataset is not downloaded again."""
+    (testdata_dir / "test_data_clavrx").mkdir()
+    monkeypatch.setattr(
+        install_cmd,
+        "download_extract_test_data",
+        lambda *args: pytest.fail("Existing dataset should not be downloaded."),
+    )
+    args = install_cmd.parser.parse_args(["test_data_clavrx"])
+    install_cmd(args)
+    assert "already exists" in capsys.readouterr().out
+
+
+def test_extract_data_cautiously_metadata(install_cmd, tmp_path):
+    """Ensure extracted files keep the mode and mtime recorded in the archive."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, mode in [("script.sh", 0o755), ("data.txt", 0o644)]:
+            info = tarfile.TarInfo(f"test_data_fake/{name}")
+            info.size, info.mode, info.mtime = 4, mode, 1234567890
+            tar.addfile(info, io.BytesIO(b"data"))
+    install_cmd.extract_data_cautiously(FakeResponse(buf.getvalue()), str(tmp_path))
+    for name, mode in [("script.sh", 0o755), ("data.txt", 0o644)]:
+        fstat = os.stat(tmp_path / "test_data_fake" / name)
+        assert fstat.st_mode & 0o777 == mode
+        assert fstat.st_mtime == 1234567890
+
+
+@pytest.mark.parametrize("has_data_filter", [True, False])
+def test_extract_data_cautiously_symlinked_dir(
+    install_cmd, members, monkeypatch, tmp_path, has_data_filter
+):
+    """Ensure extraction into a symlinked download_dir, with and without filters."""
+    if not has_data_filter:
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    response = FakeResponse(make_tgz(members))
+    install_cmd.extract_data_cautiously(response, str(tmp_path / "link"))
+    assert read_tree(tmp_path / "real") == members
+    response = FakeResponse(make_tgz({"../escaped.bin": b"unsafe"}))
+    with pytest.raises(SystemExit):
+        install_cmd.extract_data_cautiously(response, str(tmp_path / "link"))
+
+
+def test_install_multiple_datasets(install_cmd, monkeypatch, testdata_dir):
+    """Ensure 'all' installs each missing dataset once, sharing a single session."""
+    (testdata_dir / "test_data_clavrx").mkdir()
+    calls = []
+
+    def fake_download(url, download_dir, session):
+        calls.append((url, download_dir, session))
+
+    monkeypatch.setattr(install_cmd, "download_extract_test_data", fake_download)
+    args = install_cmd.parser.parse_args(["test_data_gpm", "all", "test_data_gpm"])
+    install_cmd(args)
+    expected = dict(test_dataset_dict)
+    expected.pop("test_data_clavrx")
+    assert sorted(call[0] for call in calls) == sorted(expected.values())
+    # Each dataset is extracted into its own staging directory
+    assert sorted(call[1] for call in calls) == sorted(
+        str(testdata_dir / f"{name}.partial") for name in expected
+    )
+    assert len({id(call[2]) for call in calls}) == 1
+    assert sorted(os.listdir(testdata_dir)) == ["test_data_clavrx"]
+
+
+def test_install_multiple_datasets_failure(
+    install_cmd, monkeypatch, testdata_dir, capsys
+):
+    """Ensure a failed dataset cancels those queued, and every failure is reported."""
+    monkeypatch.setattr(geoips_config, "DOWNLOAD_WORKERS", 2)
+    failing = test_dataset_names[:2]
+    barrier = threading.Barrier(len(failing), timeout=10)
+    calls = []
+
+    def fake_install(name, session, resumable):
+        if name in failing:
+            # Make sure both failures happen, rather than the second being cancelled
+            barrier.wait()
+            raise RuntimeError(name)
+        calls.append(name)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(install_cmd, "install_test_dataset", fake_install)
+    args = install_cmd.parser.parse_args(["all"])
+    with pytest.raises(RuntimeError, match=failing[0]):
+        install_cmd(args)
+    out = capsys.readouterr().out
+    for name in failing:
+        assert f"Failed to install test dataset '{name}'" in out
+    assert len(calls) < len(test_dataset_names) - len(failing)
+
+
+def test_install_single_dataset_inline(install_cmd, monkeypatch, testdata_dir):
+    """Ensure a single dataset is installed on the calling (main) thread."""
+    threads = []
+    monkeypatch.setattr(
+        install_cmd,
+        "install_test_dataset",
+        lambda *args: threads.append(threading.current_thread()),
+    )
+    install_cmd(install_cmd.parser.parse_args(["test_data_clavrx"]))
+    assert threads == [threading.main_thread()]
+
+
+def test_install_multiple_datasets_interrupted(install_cmd, monkeypatch, testdata_dir):
+    """Ensure Ctrl-C while waiting on datasets stops the installs already running."""
+    monkeypatch.setattr(install_cmd, "_cancel_event", threading.Event(), raising=False)
+    started, stopped = threading.Event(), []
+
+    def fake_install(name, session, resumable):
+        started.set()
+        assert install_cmd.cancel_event.wait(10)
+        stopped.append(name)
+        geoips_config._raise_if_cancelled(install_cmd.cancel_event)
+
+    def interrupted_wait(*args, **kwargs):
+        started.wait(10)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(install_cmd, "install_test_dataset", fake_install)
+    monkeypatch.setattr(geoips_config, "wait", interrupted_wait)
+    with pytest.raises(KeyboardInterrupt):
+        install_cmd(install_cmd.parser.parse_args(["all"]))
+    # Only the installs already running were started, and each of them stopped
+    assert 0 < len(stopped) <= geoips_config.DOWNLOAD_WORKERS
+
+
+@pytest.mark.parametrize("resumable", [True, False])
+def test_install_cancelled(install_cmd, members, monkeypatch, testdata_dir, resumable):
+    """Ensure a cancelled install stops and removes its staging directory."""
+    cancel_event = threading.Event()
+    cancel_event.set()
+    monkeypatch.setattr(install_cmd, "_cancel_event", cancel_event, raising=False)
+    with pytest.raises(KeyboardInterrupt):
+        install_cmd.install_test_dataset(
+            "test_data_clavrx", FakeRangeSession(make_tgz(members)), resumable
+        )
+    assert not (testdata_dir / "test_data_clavrx.partial").exists()
+    assert not (testdata_dir / "test_data_fake").exists()
+
+
+@pytest.mark.parametrize(
+    "partial_size, partial_etag, expected_statuses",
+    [
+        # Nothing downloaded yet
+        (None, None, [200]),
+        # Partial download of the same file, resume it
+        (1000, '"v1"', [206]),
+        # File changed on the server since the partial download, start over
+        (1000, '"v0"', [200]),
+        # Partial download is larger than the file, start over
+        (10**6, '"v1"', [416, 200]),
+        # Download already completed, nothing left to fetch
+        ("complete", '"v1"', [416]),
+    ],
+)
+def test_install_resumable(
+    install_cmd,
+    members,
+    testdata_dir,
+    partial_size,
+    partial_etag,
+    expected_statuses,
+):
+    """Ensure resumable installs continue, or restart, partial downloads."""
+    content = make_tgz(members)
+    part_path = testdata_dir / "test_data_clavrx.tgz.part"
+    if partial_size == "complete":
+        partial_size = len(content)
+    if partial_size:
+        part_path.write_bytes((content * 100)[:partial_size])
+        (testdata_dir / "test_data_clavrx.tgz.part.validator").write_text(partial_etag)
+    session = FakeRangeSession(content)
+    install_cmd.install_test_dataset("test_data_clavrx", session, resumable=True)
+    assert session.statuses == expected_statuses
+    # Extracted contents are complete and the partial download is cleaned up
+    assert read_tree(testdata_dir) == members
+
+
+def test_install_resumable_corrupt(install_cmd, members, testdata_dir):
+    """Ensure a complete download which fails to extract is downloaded again."""
+    content = make_tgz(members)
+    part_path = testdata_dir / "test_data_clavrx.tgz.part"
+    part_path.write_bytes((bytes(range(256)) * len(content))[: len(content)])
+    (testdata_dir / "test_data_clavrx.tgz.part.validator").write_text('"v1"')
+    session = FakeRangeSession(content)
+    with pytest.raises(tarfile.TarError):
+        install_cmd.install_test_dataset("test_data_clavrx", session, resumable=True)
+    assert session.statuses == [416]
+    assert os.listdir(testdata_dir) == []
+    install_cmd.install_test_dataset("test_data_clavrx", session, resumable=True)
+    assert session.statuses == [416, 200]
+    assert read_tree(testdata_dir) == members
+
+
+def test_install_staged(install_cmd, members, testdata_dir):
+    """Ensure datasets only appear in GEOIPS_TESTDATA_DIR once fully extracted."""
+    # Left over from a previously failed install
+    (testdata_dir / "test_data_clavrx.partial" / "stale").mkdir(parents=True)
+    unsafe = dict(members)
+    unsafe["../escaped.bin"] = b"unsafe"
+    with pytest.raises(SystemExit):
+        install_cmd.install_test_dataset(
+            "test_data_clavrx", FakeRangeSession(make_tgz(unsafe))
+        )
+    assert os.listdir(testdata_dir) == []
+    install_cmd.install_test_dataset(
+        "test_data_clavrx", FakeRangeSession(make_tgz(members))
+    )
+    assert os.listdir(testdata_dir) == ["test_data_fake"]
+    assert read_tree(testdata_dir) == members
+
+
+def test_install_staged_target_exists(install_cmd, members, testdata_dir):
+    """Ensure nothing is promoted over entries already in GEOIPS_TESTDATA_DIR."""
+    (testdata_dir / "test_data_fake").mkdir()
+    (testdata_dir / "test_data_fake" / "keep.txt").write_bytes(b"keep")
+    with pytest.raises(SystemExit):
+        install_cmd.install_test_dataset(
+            "test_data_clavrx", FakeRangeSession(make_tgz(members))
+        )
+    assert os.listdir(testdata_dir) == ["test_data_fake"]
+    assert read_tree(testdata_dir) == {"test_data_fake/keep.txt": b"keep"}
+
+
+def test_install_staged_rollback(install_cmd, monkeypatch, testdata_dir):
+    """Ensure entries already promoted are moved back if a later rename fails."""
+    rename = os.rename
+
+    def failing_rename(src, dst):
+        if dst == str(testdata_dir / "second"):
+            raise OSError("rename failed")
+        rename(src, dst)
+
+    monkeypatch.setattr(geoips_config, "rename", failing_rename)
+    members = {"first/a.bin": b"a", "second/b.bin": b"b"}
+    with pytest.raises(OSError, match="rename failed"):
+        install_cmd.install_test_dataset(
+            "test_data_clavrx", FakeRangeSession(make_tgz(members))
+        )
+    assert os.listdir(testdata_dir) == []
@@ -8,9 +8,12 @@ See geoips/commandline/ancillary_info/cmd_instructions.yaml for more information
 
 from glob import glob
 from importlib import resources
+import os
 from numpy.random import rand
 import pytest
+import yaml
 
+from geoips.commandline.commandline_interface import GeoipsCLI
 from tests.unit_tests.commandline.cli_top_level_tester import BaseCliTest
 
 
@@ -97,3 +100,53 @@ def test_command_combinations(monkeypatch, args):
         - List of arguments to call the CLI with (ie. ['geoips', 'validate'])
     """
     test_sub_cmd.test_command_combinations(monkeypatch, args)
+
+
+@pytest.fixture(scope="module")
+def validate_cmd():
+    """Instance of the GeoipsValidate command, as built by the CLI."""
+    args = GeoipsCLI().parser.parse_args(["validate", "plugin.yaml"])
+    return args.exe_command.__self__
+
+
+def test_load_module_from_file_cached(validate_cmd, tmp_path):
+    """Ensure modules are only reloaded once the plugin file has been modified."""
+    fpath = tmp_path / "my_plugin.py"
+    fpath.write_text('interface = "algorithms"\nname = "my_plugin"\n')
+    module = validate_cmd._load_module_from_file(fpath)
+    assert validate_cmd._load_module_from_file(fpath) is module
+    mtime = os.stat(fpath).st_mtime_ns + 10**9
+    os.utime(fpath, ns=(mtime, mtime))
+    reloaded = validate_cmd._load_module_from_file(fpath)
+    assert reloaded is not module
+    assert reloaded.name == "my_plugin"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "interface: algorithms\nfamily: list_numpy_to_numpy\n",
+        "",
+        "- interface\n- name\n",
+    ],
+    ids=["missing_name", "empty", "non_mapping"],
+)
+def test_validate_yaml_missing_interface_or_name(
+    validate_cmd, tmp_path, capsys, content
+):
+    """Ensure YAML plugins without an interface and name are reported as invalid."""
+    fpath = tmp_path / "my_plugin.yaml"
+    fpath.write_text(content)
+    with pytest.raises(SystemExit):
+        validate_cmd(validate_cmd.parser.parse_args([str(fpath)]))
+    error = capsys.readouterr().err
+    assert "doesn't have 'interface' and/or 'name' attribute[s]" in error
+    assert "is invalid." in error
+
+
+def test_validate_yaml_syntax_error_names_file(validate_cmd, tmp_path):
+    """Ensure YAML syntax errors report the path of the plugin being validated."""
+    fpath = tmp_path / "bad_plugin.yaml"
+    fpath.write_text("interface: algorithms\nname: [unclosed\n")
+    with pytest.raises(yaml.YAMLError, match=str(fpath)):
+        validate_cmd(validate_cmd.parser.parse_args([str(fpath)]))